@@ -1,22 +1,45 @@
 """The main package of sechubman."""
 
-from .boto_utils import (
-    BotoStubCall,
-    get_values_by_boto_argument,
-    stub_boto_client,
-    validate_call_params,
-)
-from .manager import Manager
-from .note_text_config import NoteTextConfig
-from .rule import Rule
-from .sechubman import validate_filters, validate_updates
-from .utils import (
-    TimeRange,
-    are_keys_in_collection,
-    are_keys_in_dataclass_fields,
-    is_valid_against_reference,
-    parse_timestamp_str_if_set,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .boto_utils import (
+        BotoStubCall,
+        get_values_by_boto_argument,
+        stub_boto_client,
+        validate_call_params,
+    )
+    from .manager import Manager
+    from .note_text_config import NoteTextConfig
+    from .rule import Rule
+    from .sechubman import validate_filters, validate_updates
+    from .utils import (
+        TimeRange,
+        are_keys_in_collection,
+        are_keys_in_dataclass_fields,
+        is_valid_against_reference,
+        parse_timestamp_str_if_set,
+    )
+
+# Submodules are only imported when one of their names is first accessed,
+# so importing the package does not pull in botocore unless needed
+_LAZY_IMPORTS = {
+    "BotoStubCall": ".boto_utils",
+    "get_values_by_boto_argument": ".boto_utils",
+    "stub_boto_client": ".boto_utils",
+    "validate_call_params": ".boto_utils",
+    "Manager": ".manager",
+    "NoteTextConfig": ".note_text_config",
+    "Rule": ".rule",
+    "validate_filters": ".sechubman",
+    "validate_updates": ".sechubman",
+    "TimeRange": ".utils",
+    "are_keys_in_collection": ".utils",
+    "are_keys_in_dataclass_fields": ".utils",
+    "is_valid_against_reference": ".utils",
+    "parse_timestamp_str_if_set": ".utils",
+}
 
 __all__ = [
     "BotoStubCall",
@@ -34,3 +57,18 @@ __all__ = [
     "validate_filters",
     "validate_updates",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import the public names of the package lazily (PEP 562)."""
+    if name not in _LAZY_IMPORTS:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module attributes together with the public names that are only imported on first access."""
+    return sorted(set(globals()) | set(__all__))
@@ -5,6 +5,7 @@ from pathlib import Path
 from aws_lambda_powertools import Logger
 from aws_lambda_powertools.logging import utils
 from boto3 import client
+from botocore.config import Config
 from yaml import safe_load
 
 from sechubman import Manager
@@ -18,7 +19,11 @@ def _get_rules(rules_path: str = "rules.yaml") -> dict:
         return safe_load(file)
 
 
-SECURITYHUB_CLIENT = client("securityhub")
+# Adaptive retries back off on SecurityHub throttling and transient errors,
+# instead of failing the batch updates of a run
+SECURITYHUB_CLIENT = client(
+    "securityhub", config=Config(retries={"max_attempts": 10, "mode": "adaptive"})
+)
 
 
 def _get_manager(rules: dict) -> Manager:
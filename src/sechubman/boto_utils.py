@@ -1,13 +1,15 @@
 """Boto-related utilities for sechubman."""
 
 import sys
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from contextlib import contextmanager
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
+from operator import methodcaller
 from typing import Any
 
 from botocore.client import BaseClient
 from botocore.stub import Stubber
+from botocore.validate import validate_parameters
 from jmespath import compile as jmespath_compile
 
 # This only contains the special cases that are still relevant for the current finding format
@@ -89,6 +91,31 @@ SPECIAL_CASE_EXPRESSIONS = {
 }
 
 
+def _create_nested_getter(path: str) -> Callable[[dict], Any]:
+    """Create a getter for a plain dotted path, equivalent to its jmespath expression."""
+    keys = tuple(path.split("."))
+
+    def getter(finding: dict) -> Any:  # noqa: ANN401
+        value: Any = finding
+        for key in keys:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+        return value
+
+    return getter
+
+
+# Plain dotted paths are resolved with direct dict lookups,
+# only paths with list projections go through jmespath
+SPECIAL_CASE_GETTERS: dict[str, Callable[[dict], Any]] = {
+    name: SPECIAL_CASE_EXPRESSIONS[name].search
+    if "[" in path
+    else _create_nested_getter(path)
+    for name, path in SPECIAL_CASES.items()
+}
+
+
 def _normalize_values(value: object) -> list[Any]:
     """Normalize to a list with only truthy values."""
     if isinstance(value, list):
@@ -118,12 +145,34 @@ def get_values_by_boto_argument(finding: dict, name: str) -> list[Any]:
     list[Any]
         The values from the finding for the given name
     """
-    if expression := SPECIAL_CASE_EXPRESSIONS.get(name):
-        return _normalize_values(expression.search(finding))
-    return _normalize_values(finding.get(name))
+    return create_boto_argument_getter(name)(finding)
+
+
+def create_boto_argument_getter(name: str) -> Callable[[dict], list[Any]]:
+    """Create a function getting the values in a finding for a given boto argument name.
+
+    The lookup of the name is resolved once, so the function can be reused for many findings,
+    unlike get_values_by_boto_argument which creates it on every call.
+
+    Parameters
+    ----------
+    name : str
+        The name to get the values for
+
+    Returns
+    -------
+    Callable[[dict], list[Any]]
+        A function returning the values from a finding for the given name
+    """
+    getter = SPECIAL_CASE_GETTERS.get(name) or methodcaller("get", name)
+
+    def get_values(finding: dict) -> list[Any]:
+        return _normalize_values(getter(finding))
 
+    return get_values
 
-@dataclass
+
+@dataclass(slots=True)
 class BotoStubCall:
     """Dataclass representing the inputs needed to stub a boto call."""
 
@@ -174,8 +223,14 @@ def stub_boto_client(
         because the stubbing is active on the original session client within the context as a side effect.
     """
     stubber = Stubber(boto_session_client)
+    add_response = stubber.add_response
     for call in calls:
-        stubber.add_response(**asdict(call))
+        # Pass the fields directly, asdict would needlessly deep-copy the responses
+        add_response(
+            method=call.method,
+            service_response=call.service_response,
+            expected_params=call.expected_params,
+        )
     stubber.activate()
     try:
         yield stubber
@@ -191,7 +246,10 @@ def validate_call_params(
     boto_stub_calls: list[BotoStubCall],
     boto_session_client: BaseClient,
 ) -> None:
-    """Validate boto call parameters by attempting to call the methods with the expected parameters in a stubbed context.
+    """Validate boto call parameters against the input shapes of the client's operations.
+
+    Only the parameter validation botocore runs before making a call is done,
+    so no stubber or request machinery is involved.
 
     Parameters
     ----------
@@ -204,10 +262,15 @@ def validate_call_params(
     ------
     botocore.exceptions.ParamValidationError
         If any of the boto parameters contain invalid values
+    ValueError
+        If the client does not have one of the methods
     """
-    with stub_boto_client(
-        boto_session_client,
-        boto_stub_calls,
-    ) as _:
-        for response in boto_stub_calls:
-            getattr(boto_session_client, response.method)(**response.expected_params)
+    client_meta = boto_session_client.meta
+    for call in boto_stub_calls:
+        operation_name = client_meta.method_to_api_mapping.get(call.method)
+        if operation_name is None:
+            # The same error as the Stubber raises for unknown methods
+            msg = f"Client {client_meta.service_model.service_name} does not have method: {call.method}"
+            raise ValueError(msg)
+        operation_model = client_meta.service_model.operation_model(operation_name)
+        validate_parameters(call.expected_params or {}, operation_model.input_shape)
@@ -6,7 +6,7 @@ from typing import ClassVar
 from .filters_interface import Criterion, Filter
 
 
-@dataclass
+@dataclass(slots=True)
 class CidrCriterion(Criterion):
     """Dataclass representing a SecurityHub Cidr Criterion.
 
@@ -34,7 +34,7 @@ class CidrCriterion(Criterion):
         return self.Cidr == finding_value
 
 
-@dataclass
+@dataclass(slots=True)
 class CidrFilter(Filter[str, CidrCriterion]):
     """Dataclass representing a SecurityHub CidrFilter to be applied on a single finding attribute."""
 
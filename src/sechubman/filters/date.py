@@ -2,14 +2,28 @@
 
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from typing import ClassVar
 
 from sechubman.utils import TimeRange
 
 from .filters_interface import Criterion, Filter
 
+# Relative date ranges are resolved against the current time truncated to this resolution,
+# so their start can be up to NOW_RESOLUTION_SECONDS - 1 seconds earlier than exactly 'now' minus the days,
+# and findings up to that much older than the exact cutoff can still match
+NOW_RESOLUTION_SECONDS = 60
 
-@dataclass
+
+@lru_cache(maxsize=64)
+def _relative_start(days: int, now_bucket: int) -> datetime:
+    """Get the start of a relative date range of 'days' before the 'now_bucket'."""
+    return datetime.fromtimestamp(now_bucket * NOW_RESOLUTION_SECONDS, UTC) - timedelta(
+        days=days
+    )
+
+
+@dataclass(slots=True)
 class DateCriterion(Criterion):
     """Dataclass representing a SecurityHub Date Criterion.
 
@@ -17,7 +31,7 @@ class DateCriterion(Criterion):
 
     Parameters
     ----------
-    DateRange : dict[str, str]
+    DateRange : dict[str, str] | None
         Optionally specify a relative date range with a 'Value' key indicating the number of days
     End : str
         Optionally specify an absolute end date in ISO format
@@ -25,9 +39,10 @@ class DateCriterion(Criterion):
         Optionally specify an absolute start date in ISO format
     """
 
-    DateRange: dict[str, str] = field(default_factory=dict)
+    DateRange: dict[str, str] | None = None
     End: str = ""
     Start: str = ""
+    time_range: TimeRange = field(init=False, repr=False, compare=False)
 
     def _now_utc(self) -> datetime:
         """Having this method allows for easier mocking in tests."""
@@ -37,7 +52,10 @@ class DateCriterion(Criterion):
         """Initialize the date criterion on DateRange or Start/End."""
         self.time_range = (
             TimeRange(
-                self._now_utc() - timedelta(days=int(self.DateRange["Value"])),
+                _relative_start(
+                    int(self.DateRange["Value"]),
+                    int(self._now_utc().timestamp()) // NOW_RESOLUTION_SECONDS,
+                ),
                 None,
             )
             if self.DateRange
@@ -60,7 +78,7 @@ class DateCriterion(Criterion):
         return self.time_range.is_timestamp_str_in_range(finding_value)
 
 
-@dataclass
+@dataclass(slots=True)
 class DateFilter(Filter[str, DateCriterion]):
     """Dataclass representing a SecurityHub DateFilter to be applied on a single finding attribute."""
 
@@ -1,12 +1,13 @@
 """Convenient functionality to create AWS SecurityHub Finding Filters in a dynamic way."""
 
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
 from botocore.client import BaseClient
 
 from sechubman.sechubman import validate_filters
-from sechubman.utils import are_keys_in_dataclass_fields
+from sechubman.utils import _get_field_names
 
 from .cidr import CidrFilter
 from .date import DateFilter
@@ -30,6 +31,30 @@ class AllFilters(Enum):
     CIDR_FILTERS = CidrFilter
 
 
+# The criterion init field names of every filter type, in AllFilters order, computed once at import
+# Fields derived in __post_init__ are left out, since they cannot be passed in a filter dict
+_FIELD_SETS: tuple[tuple[frozenset[str], type[Filter]], ...] = tuple(
+    (
+        _get_field_names(filter_type.value.criterion_type, init_only=True),
+        filter_type.value,
+    )
+    for filter_type in AllFilters
+)
+
+
+@lru_cache(maxsize=32)
+def _match_by_keyset(keys: frozenset[str]) -> type[Filter]:
+    """Match a set of filter keys to an AwsSecurityFindingFilters type.
+
+    The mapping is pure, so results are cached per distinct set of keys.
+    """
+    for field_set, filter_type in _FIELD_SETS:
+        if keys <= field_set:
+            return filter_type
+    msg = f"No filter type matches the keys {sorted(keys)}"
+    raise ValueError(msg)
+
+
 def match_to_filter_type(
     filter_dict: dict[str, Any],
 ) -> type[Filter]:
@@ -44,12 +69,13 @@ def match_to_filter_type(
     -------
     type[Filter]
         The matched AwsSecurityFindingFilters type
+
+    Raises
+    ------
+    ValueError
+        If no AwsSecurityFindingFilters type has all the keys of the filters dict
     """
-    return next(
-        filter_type.value
-        for filter_type in AllFilters
-        if are_keys_in_dataclass_fields(filter_dict, filter_type.value.criterion_type)
-    )
+    return _match_by_keyset(frozenset(filter_dict))
 
 
 def create_filters(
@@ -2,13 +2,13 @@
 
 from abc import ABC, abstractmethod
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TypeVar
 
 TInput = TypeVar("TInput")
 
 
-@dataclass
+@dataclass(slots=True)
 class Criterion[TInput](ABC):
     """Abstract base class for AWS Security Finding Filter criterion.
 
@@ -34,7 +34,7 @@ class Criterion[TInput](ABC):
 TFilter = TypeVar("TFilter", bound=Criterion)
 
 
-@dataclass
+@dataclass(slots=True)
 class Filter[TInput, TFilter: Criterion](ABC):
     """Abstract base class for an AWS Security Finding Filter.
 
@@ -45,6 +45,15 @@ class Filter[TInput, TFilter: Criterion](ABC):
 
     criterions: tuple[TFilter, ...]
     combined_comparison: Callable = any
+    # Only used by the match below, so subclasses that override match
+    # can skip Filter.__post_init__ and keep the empty default
+    _match_functions: tuple[Callable[[TInput], bool], ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Bind the match methods of the criterions once, since they are called for every finding value."""
+        self._match_functions = tuple(criterion.match for criterion in self.criterions)
 
     @property
     @abstractmethod
@@ -65,6 +74,22 @@ class Filter[TInput, TFilter: Criterion](ABC):
         bool
             True if the finding_value matches the combined criterions, False otherwise
         """
-        return self.combined_comparison(
-            criterion.match(finding_value) for criterion in self.criterions
+        # Explicit short-circuiting loops for the built-in combiners,
+        # since this is evaluated for every finding value
+        match_functions = self._match_functions
+        combined_comparison = self.combined_comparison
+        if len(match_functions) == 1 and combined_comparison in (any, all):
+            return match_functions[0](finding_value)
+        if combined_comparison is any:
+            for criterion_match in match_functions:
+                if criterion_match(finding_value):
+                    return True
+            return False
+        if combined_comparison is all:
+            for criterion_match in match_functions:
+                if not criterion_match(finding_value):
+                    return False
+            return True
+        return combined_comparison(
+            criterion_match(finding_value) for criterion_match in match_functions
         )
@@ -1,22 +1,32 @@
 """AWS SecurityHub Finding String Filters."""
 
-from dataclasses import dataclass
-from enum import Enum
-from functools import partial
+import sys
+from dataclasses import dataclass, field
+from enum import Enum, member
 from typing import ClassVar
 
 from .filters_interface import Filter
-from .string import _get_combined_comparison, _StringLikeCriterion
+from .string import (
+    _NEGATIVE_COMPARISONS,
+    _get_combined_comparison,
+    _StringLikeCriterion,
+)
 
 
 class MapStringComparisons(Enum):
     """The available map string comparison operations linked to their functions."""
 
-    EQUALS = partial(str.__eq__)
-    NOT_EQUALS = partial(str.__ne__)
+    EQUALS = member(str.__eq__)
+    NOT_EQUALS = member(str.__ne__)
 
 
-@dataclass
+# Plain lookup table to skip the Enum machinery when creating criterions
+_MAP_COMPARISONS = {
+    comparison.name: comparison.value for comparison in MapStringComparisons
+}
+
+
+@dataclass(slots=True)
 class MapCriterion(_StringLikeCriterion):
     """Dataclass representing a SecurityHub Map Criterion.
 
@@ -34,7 +44,14 @@ class MapCriterion(_StringLikeCriterion):
 
     def __post_init__(self) -> None:
         """Get the comparison function based on the Comparison attribute."""
-        self.comparison_func = MapStringComparisons[self.Comparison].value
+        self.comparison_func = _MAP_COMPARISONS[self.Comparison]
+        self.is_negative = self.Comparison in _NEGATIVE_COMPARISONS
+        # Interned strings let equality checks and key lookups short-circuit on identity
+        # Only exact str values can be interned, other values are kept as given
+        if type(self.Key) is str:
+            self.Key = sys.intern(self.Key)
+        if type(self.Value) is str:
+            self.Value = sys.intern(self.Value)
 
     def match(self, finding_value: dict[str, str]) -> bool:
         """Check if a string from a map in the finding matches this string criterion.
@@ -54,12 +71,15 @@ class MapCriterion(_StringLikeCriterion):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MapFilter(Filter[dict[str, str], MapCriterion]):
     """Dataclass representing a SecurityHub MapFilter to be applied on a single finding attribute."""
 
     criterion_type: ClassVar[type] = MapCriterion
     criterions: tuple[MapCriterion, ...]
+    _values_by_key: tuple[tuple[str, frozenset[str]], ...] = field(
+        init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Initialize the combined comparison function based on the types of criterions.
@@ -68,3 +88,36 @@ class MapFilter(Filter[dict[str, str], MapCriterion]):
         Raise ValueError if mixed criterions are found.
         """
         self.combined_comparison = _get_combined_comparison(self.criterions)
+        values_by_key: dict[str, set[str]] = {}
+        for criterion in self.criterions:
+            values_by_key.setdefault(criterion.Key, set()).add(criterion.Value)
+        self._values_by_key = tuple(
+            (key, frozenset(values)) for key, values in values_by_key.items()
+        )
+
+    def match(self, finding_value: dict[str, str]) -> bool:
+        """
+        Check if a finding map matches the filter's criterions.
+
+        Instead of evaluating each criterion, the criterion values are grouped by key,
+        so each key of the finding map is looked up once and checked with a single set lookup.
+
+        Parameters
+        ----------
+        finding_value : dict[str, str]
+            The map from the finding to compare against the criterions
+
+        Returns
+        -------
+        bool
+            True if the finding_value matches the combined criterions, False otherwise
+        """
+        if self.combined_comparison is any:
+            for key, values in self._values_by_key:
+                if finding_value.get(key) in values:
+                    return True
+            return False
+        for key, values in self._values_by_key:
+            if key not in finding_value or finding_value[key] in values:
+                return False
+        return True
@@ -1,8 +1,9 @@
 """AWS SecurityHub Finding String Filters."""
 
+import operator
 from collections.abc import Callable
-from dataclasses import dataclass
-from enum import Enum
+from dataclasses import dataclass, field
+from enum import Enum, member
 from functools import partial
 from typing import ClassVar
 
@@ -12,20 +13,25 @@ from .filters_interface import Criterion, Filter
 class NumberComparisons(Enum):
     """The available number comparison operations linked to their functions."""
 
-    Eq = partial(float.__eq__)
-    Gt = partial(float.__gt__)
-    Gte = partial(float.__ge__)
-    Lt = partial(float.__lt__)
-    Lte = partial(float.__le__)
+    Eq = member(operator.eq)
+    Gt = member(operator.gt)
+    Gte = member(operator.ge)
+    Lt = member(operator.lt)
+    Lte = member(operator.le)
 
 
-def _set_second_argument(
-    func: Callable[[float, float], bool], b: float
-) -> Callable[[float], bool]:
-    return lambda a: func(a, b)
+# The reflected operator of each comparison, so the criterion value can be bound as the first argument,
+# e.g. 'finding_value > Gt' is evaluated as 'operator.lt(Gt, finding_value)'
+_REFLECTED_NUMBER_COMPARISONS = {
+    "Eq": operator.eq,
+    "Gt": operator.lt,
+    "Gte": operator.le,
+    "Lt": operator.gt,
+    "Lte": operator.ge,
+}
 
 
-@dataclass
+@dataclass(slots=True)
 class NumberCriterion(Criterion):
     """Dataclass representing a SecurityHub Number Criterion.
 
@@ -48,13 +54,17 @@ class NumberCriterion(Criterion):
     Gte: float | None = None
     Lt: float | None = None
     Lte: float | None = None
+    comparison_functions: tuple[Callable[[float], bool], ...] = field(
+        init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Get the comparison functions based on which attributes are set."""
+        # Bind each set value directly to the reflected operator of its comparison
         self.comparison_functions = tuple(
-            _set_second_argument(number_comparison.value, comparison_value)
-            for number_comparison in NumberComparisons
-            if (comparison_value := getattr(self, number_comparison.name)) is not None
+            partial(reflected_comparison, comparison_value)
+            for name, reflected_comparison in _REFLECTED_NUMBER_COMPARISONS.items()
+            if (comparison_value := getattr(self, name)) is not None
         )
         if not self.comparison_functions:
             msg = "At least one comparison operation must be specified."
@@ -73,15 +83,14 @@ class NumberCriterion(Criterion):
         bool
             True if the finding_value matches the criterion, False otherwise
         """
+        # The operator functions compare ints and floats alike, so no cast to float is needed
         return all(
-            # duck typing int to float does not work when using partial on float methods
-            # therefore explicitly cast finding_value to float
-            comparison_function(float(finding_value))
+            comparison_function(finding_value)
             for comparison_function in self.comparison_functions
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class NumberFilter(Filter[float, NumberCriterion]):
     """Dataclass representing a SecurityHub NumberFilter to be applied on a single finding attribute."""
 
@@ -7,7 +7,7 @@ from typing import ClassVar
 from .filters_interface import Criterion, Filter
 
 
-@dataclass
+@dataclass(slots=True)
 class RegexStringCriterion(Criterion[str]):
     """Dataclass representing a regex string criterion.
 
@@ -32,7 +32,7 @@ class RegexStringCriterion(Criterion[str]):
         return bool(self._pattern.search(finding_value))
 
 
-@dataclass
+@dataclass(slots=True)
 class RegexStringFilter(Filter[str, RegexStringCriterion]):
     """Dataclass representing regex string filters for a finding field."""
 
@@ -1,9 +1,9 @@
 """AWS SecurityHub Finding String Filters."""
 
-from collections.abc import Callable
-from dataclasses import dataclass
-from enum import Enum
-from functools import partial
+import sys
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from enum import Enum, member
 from typing import ClassVar
 
 from .filters_interface import Criterion, Filter
@@ -16,13 +16,22 @@ def _str_prefix_ne_func(a: str, b: str) -> bool:
 class StringComparisons(Enum):
     """The available string comparison operations linked to their functions."""
 
-    EQUALS = partial(str.__eq__)
-    PREFIX = partial(str.startswith)
-    NOT_EQUALS = partial(str.__ne__)
-    PREFIX_NOT_EQUALS = partial(_str_prefix_ne_func)
+    EQUALS = member(str.__eq__)
+    PREFIX = member(str.startswith)
+    NOT_EQUALS = member(str.__ne__)
+    PREFIX_NOT_EQUALS = member(_str_prefix_ne_func)
 
 
-@dataclass
+# Plain lookup table to skip the Enum machinery when creating criterions
+_STRING_COMPARISONS = {
+    comparison.name: comparison.value for comparison in StringComparisons
+}
+
+# The comparisons that must not hold for a value, shared with the map string comparisons
+_NEGATIVE_COMPARISONS = frozenset({"NOT_EQUALS", "PREFIX_NOT_EQUALS"})
+
+
+@dataclass(slots=True)
 class _StringLikeCriterion(Criterion):
     """Dataclass representing a SecurityHub StringLike Criterion.
 
@@ -36,9 +45,13 @@ class _StringLikeCriterion(Criterion):
 
     Comparison: str
     Value: str
+    comparison_func: Callable[[str, str], bool] = field(
+        init=False, repr=False, compare=False
+    )
+    is_negative: bool = field(init=False, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class StringCriterion(_StringLikeCriterion):
     """Dataclass representing a SecurityHub String Criterion.
 
@@ -52,7 +65,13 @@ class StringCriterion(_StringLikeCriterion):
 
     def __post_init__(self) -> None:
         """Get the comparison function based on the Comparison attribute."""
-        self.comparison_func = StringComparisons[self.Comparison].value
+        self.comparison_func = _STRING_COMPARISONS[self.Comparison]
+        # Not a prefix check, since PREFIX_NOT_EQUALS is also negative
+        self.is_negative = self.Comparison in _NEGATIVE_COMPARISONS
+        # Interned strings let equality checks short-circuit on identity
+        # Only exact str values can be interned, other values are kept as given
+        if type(self.Value) is str:
+            self.Value = sys.intern(self.Value)
 
     def match(self, finding_value: str) -> bool:
         """Check if a string from a finding matches this string criterion.
@@ -71,25 +90,39 @@ class StringCriterion(_StringLikeCriterion):
 
 
 def _get_combined_comparison(criterions: tuple[_StringLikeCriterion, ...]) -> Callable:
-    negatives = tuple("NOT" in criterion.Comparison for criterion in criterions)
-    if not any(negatives):
-        return any
-    if all(negatives):
-        return all
-    msg = """
+    saw_positive = saw_negative = False
+    for criterion in criterions:
+        if criterion.is_negative:
+            saw_negative = True
+        else:
+            saw_positive = True
+        if saw_positive and saw_negative:
+            msg = """
             Mixed positive and negative string/map criterions are not supported:
             https://docs.aws.amazon.com/securityhub/1.0/APIReference/API_StringFilter.html
             https://docs.aws.amazon.com/securityhub/1.0/APIReference/API_MapFilter.html
             """
-    raise ValueError(msg)
+            raise ValueError(msg)
+    return all if saw_negative else any
+
 
+def _remove_redundant_prefixes(prefixes: list[str]) -> tuple[str, ...]:
+    """Remove prefixes that start with another prefix, since they can never change the outcome."""
+    kept: list[str] = []
+    for prefix in sorted(set(prefixes), key=len):
+        if not prefix.startswith(tuple(kept)):
+            kept.append(prefix)
+    return tuple(kept)
 
-@dataclass
+
+@dataclass(slots=True)
 class StringFilter(Filter[str, StringCriterion]):
     """Dataclass representing a SecurityHub StringFilter to be applied on a single finding attribute."""
 
     criterion_type: ClassVar[type] = StringCriterion
     criterions: tuple[StringCriterion, ...]
+    _equality_values: frozenset[str] = field(init=False, repr=False, compare=False)
+    _prefix_values: tuple[str, ...] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Initialize the combined comparison function based on the types of criterions.
@@ -98,3 +131,67 @@ class StringFilter(Filter[str, StringCriterion]):
         Raise ValueError if mixed criterions are found.
         """
         self.combined_comparison = _get_combined_comparison(self.criterions)
+        self._equality_values = frozenset(
+            criterion.Value
+            for criterion in self.criterions
+            if criterion.Comparison in {"EQUALS", "NOT_EQUALS"}
+        )
+        self._prefix_values = _remove_redundant_prefixes(
+            [
+                criterion.Value
+                for criterion in self.criterions
+                if criterion.Comparison in {"PREFIX", "PREFIX_NOT_EQUALS"}
+            ]
+        )
+
+    def match(self, finding_value: str) -> bool:
+        """
+        Check if a finding value matches the filter's criterions.
+
+        Instead of evaluating each criterion, the criterion values are grouped by comparison type,
+        so a finding value is checked with a single set lookup and a single startswith call.
+
+        Parameters
+        ----------
+        finding_value : str
+            The value from the finding to compare against the criterions
+
+        Returns
+        -------
+        bool
+            True if the finding_value matches the combined criterions, False otherwise
+        """
+        is_match = finding_value in self._equality_values or finding_value.startswith(
+            self._prefix_values
+        )
+        return is_match if self.combined_comparison is any else not is_match
+
+    def match_many(self, finding_values: Iterable[str]) -> list[bool]:
+        """
+        Check for each of many finding values if it matches the filter's criterions.
+
+        The grouped criterion values are looked up once for all finding values,
+        so each value is checked with a single set lookup and a single startswith call,
+        without a match call per value.
+
+        Parameters
+        ----------
+        finding_values : Iterable[str]
+            The values from the findings to compare against the criterions
+
+        Returns
+        -------
+        list[bool]
+            For each finding value, True if it matches the combined criterions, False otherwise
+        """
+        equality_values = self._equality_values
+        prefix_values = self._prefix_values
+        if self.combined_comparison is any:
+            return [
+                value in equality_values or value.startswith(prefix_values)
+                for value in finding_values
+            ]
+        return [
+            not (value in equality_values or value.startswith(prefix_values))
+            for value in finding_values
+        ]
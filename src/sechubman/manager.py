@@ -56,9 +56,17 @@ class Manager:
             self._rules.append(Rule(**merged_input, client=self.client))
         return self._rules
 
-    def get_and_update_all(self) -> bool:
+    def get_and_update_all(self, max_workers: int = 1) -> bool:
         """Get all the findings matching the rules' filters from AWS SecurityHub and update them according to the rules' updates.
 
+        The rules are applied one after the other, since the updates of a rule may change which findings match the next rules.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            The maximum number of concurrent batch_update_findings calls per rule, by default 1.
+            Mind the SecurityHub rate limits when increasing this.
+
         Returns
         -------
         bool
@@ -67,7 +75,7 @@ class Manager:
         all_success = True
         for index, rule in enumerate(self._rules):
             LOGGER.info("Updating findings for rule no. %d", index + 1)
-            success = rule.get_and_update()
+            success = rule.get_and_update(max_workers=max_workers)
             if not success:
                 all_success = False
         return all_success
@@ -2,26 +2,39 @@
 
 import json
 import logging
-from collections.abc import Mapping
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any
 
 from botocore.client import BaseClient
 
 from .boto_utils import (
-    get_values_by_boto_argument,
+    SPECIAL_CASES,
+    create_boto_argument_getter,
 )
 from .filters import (
+    DateFilter,
     Filter,
+    MapFilter,
     RegexStringFilter,
+    StringFilter,
     create_filters,
     create_regex_string_filters,
+    match_to_filter_type,
 )
 from .note_text_config import NoteTextConfig
 from .sechubman import validate_filters, validate_updates
 
 LOGGER = logging.getLogger(__name__)
 
+_get_finding_identifier = itemgetter("Id", "ProductArn")
+
+# The maximum number of findings per page and per batch_update_findings call supported by the API
+MAX_BATCH_SIZE = 100
+
 
 ALLOWED_EXTRA_FEATURES = {
     "RegexStringFilters",
@@ -29,23 +42,102 @@ ALLOWED_EXTRA_FEATURES = {
     "QuickNote",
 }
 
-
-@dataclass
+# A filter paired with the getter for the finding values it applies to
+type _BoundFilter = tuple[Callable[[dict[str, Any]], list[Any]], Filter[Any, Any]]
+
+
+def _get_top_level_finding_key(filter_name: str) -> str:
+    """Get the top-level finding key under which the values for a filter name are found."""
+    path = SPECIAL_CASES.get(filter_name, filter_name)
+    return path.split(".", 1)[0].removesuffix("[]")
+
+
+@lru_cache(maxsize=256)
+def _create_shared_filters(
+    filters_items: tuple[tuple[tuple[str, Any], ...], ...],
+) -> Filter[Any, Any]:
+    """Create filters from the items of filters dicts, shared by all rules with the same filters."""
+    return create_filters([dict(items) for items in filters_items])
+
+
+def _create_rule_filters(filters_dicts: list[dict[str, Any]]) -> Filter[Any, Any]:
+    """Create the filters for a rule, reusing the instance of rules with the same filters.
+
+    Rules only use their filters internally and never change them, so rules with the same filters,
+    e.g. from a shared Manager DefaultRuleInput, can share a single instance.
+    Relative date ranges depend on the current time, so date filters are always created anew,
+    as are filters with unhashable values.
+    """
+    if match_to_filter_type(filters_dicts[0]) is DateFilter:
+        return create_filters(filters_dicts)
+    filters_items = tuple(
+        tuple(sorted(filters_dict.items())) for filters_dict in filters_dicts
+    )
+    try:
+        hash(filters_items)
+    except TypeError:
+        return create_filters(filters_dicts)
+    return _create_shared_filters(filters_items)
+
+
+def _estimate_filter_cost(named_filter: tuple[str, Filter[Any, Any]]) -> int:
+    """Estimate the relative cost of evaluating a filter on a finding.
+
+    Values behind list projections are looked up with jmespath, which is slower than plain dict lookups.
+    StringFilters match in constant time, MapFilters do one lookup per distinct key,
+    other filters evaluate each criterion.
+    """
+    filter_name, finding_filter = named_filter
+    lookup_cost = 2 if "[" in SPECIAL_CASES.get(filter_name, "") else 1
+    if isinstance(finding_filter, StringFilter):
+        match_cost = 1
+    elif isinstance(finding_filter, MapFilter):
+        match_cost = len({criterion.Key for criterion in finding_filter.criterions})
+    else:
+        match_cost = len(finding_filter.criterions)
+    return lookup_cost * match_cost
+
+
+@dataclass(slots=True)
 class Rule:
-    """Dataclass representing a SecurityHub management rule."""
+    """Dataclass representing a SecurityHub management rule.
+
+    The Filters map one-to-one to the SecurityHub API filters.
+    When getting findings from SecurityHub they are applied server-side,
+    so only the ExtraFeatures.RegexStringFilters are checked client-side.
+    Matching all the filters client-side is only done in match, for findings from other sources.
+    """
 
     Filters: dict[str, list[dict[str, Any]]]
     UpdatesToFilteredFindings: dict[str, Any]
     client: BaseClient
     ExtraFeatures: dict[str, Any] = field(default_factory=dict)
+    _filters: tuple[_BoundFilter, ...] = field(init=False, repr=False, compare=False)
+    _regex_string_filters: tuple[_BoundFilter, ...] = field(
+        init=False, repr=False, compare=False
+    )
+    _required_finding_keys: frozenset[str] = field(
+        init=False, repr=False, compare=False
+    )
+    _note_text_config: NoteTextConfig = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate the rule upon initialization."""
         self._validate_extra_features()
         self._apply_quick_note()
         self._validate_boto_compatibility()
+        # Frozen as tuples of (getter, filter) pairs, since they are only iterated when matching
         self._filters = self._create_filters()
-        self._regex_string_filters = self._create_regex_string_filters()
+        regex_string_filters = self._create_regex_string_filters()
+        self._regex_string_filters = tuple(
+            (create_boto_argument_getter(filter_name), regex_string_filter)
+            for filter_name, regex_string_filter in regex_string_filters.items()
+        )
+        # A finding without any values for a filter cannot match it,
+        # so findings missing one of these keys are rejected before evaluating any filter
+        self._required_finding_keys = frozenset(
+            map(_get_top_level_finding_key, [*self.Filters, *regex_string_filters])
+        )
         self._note_text_config = self._create_note_text_config()
 
     def _validate_extra_features(self) -> None:
@@ -113,19 +205,18 @@ class Rule:
     def _create_simple_updates(
         self, findings: list[dict[str, Any]], overrides: dict[str, Any] | None = None
     ) -> dict[str, Any]:
-        if overrides is None:
-            overrides = {}
-        updates = self.UpdatesToFilteredFindings.copy()
-        updates["FindingIdentifiers"] = [
-            {
-                "Id": finding["Id"],
-                "ProductArn": finding["ProductArn"],
-            }
-            for finding in findings
-        ]
-        for override_key, override_value in overrides.items():
-            updates[override_key] = override_value
-        return updates
+        # Build the payload in one go, without mutating a copy of the updates
+        return {
+            **self.UpdatesToFilteredFindings,
+            "FindingIdentifiers": [
+                {
+                    "Id": finding_id,
+                    "ProductArn": product_arn,
+                }
+                for finding_id, product_arn in map(_get_finding_identifier, findings)
+            ],
+            **(overrides or {}),
+        }
 
     def _create_json_note(self, note_text: str) -> dict[str, str]:
         note_update = self.UpdatesToFilteredFindings["Note"].copy()
@@ -221,18 +312,27 @@ class Rule:
 
     def _create_filters(
         self,
-    ) -> dict[str, Filter[Any, Any]]:
+    ) -> tuple[_BoundFilter, ...]:
         """Get the rule's filters as AwsSecurityFindingFilters instances.
 
+        The filters are ordered cheapest first, so non-matching findings are rejected as early as possible.
+
         Returns
         -------
-        dict[str, AwsSecurityFindingFilters]
-            The rule's filters as AwsSecurityFindingFilters instances
+        tuple[tuple[Callable, AwsSecurityFindingFilters], ...]
+            The rule's filters as pairs of the getter for their finding values and AwsSecurityFindingFilters instance
         """
-        return {
-            filter_name: create_filters(filters_dicts)
-            for filter_name, filters_dicts in self.Filters.items()
-        }
+        named_filters = sorted(
+            (
+                (filter_name, _create_rule_filters(filters_dicts))
+                for filter_name, filters_dicts in self.Filters.items()
+            ),
+            key=_estimate_filter_cost,
+        )
+        return tuple(
+            (create_boto_argument_getter(filter_name), finding_filter)
+            for filter_name, finding_filter in named_filters
+        )
 
     def _batch_update_findings(self, update: dict[str, Any]) -> bool:
         """Batch update findings in AWS SecurityHub."""
@@ -270,54 +370,104 @@ class Rule:
 
         return any_unprocessed
 
-    def get_and_update(self) -> bool:
+    def _iter_matched_findings_batches(
+        self, pages: Iterable[dict[str, Any]]
+    ) -> Generator[list[dict[str, Any]], None, None]:
+        """Yield the matched findings of the pages in batches of at most MAX_BATCH_SIZE findings.
+
+        Matches are collected across pages, so client-side filtering does not lead to many small batch updates.
+        Findings that were already yielded for an earlier page are skipped, to not spend API calls on them twice.
+        Findings can reappear on a later page when they change server-side during pagination,
+        so the identifiers are kept for the whole run.
+        This costs one (Id, ProductArn) tuple per matched finding,
+        which get_and_update holds anyway in the update payloads until all pages are fetched.
+        """
+        batch: list[dict[str, Any]] = []
+        seen_identifiers: set[tuple[str, str]] = set()
+        for page in pages:
+            matched_findings = []
+            for finding in page["Findings"]:
+                identifier = _get_finding_identifier(finding)
+                # SecurityHub already applied the Filters server-side,
+                # so only the regex string filters are left to check client-side
+                if identifier in seen_identifiers or not self._match(
+                    finding, self._regex_string_filters
+                ):
+                    continue
+                seen_identifiers.add(identifier)
+                matched_findings.append(finding)
+
+            if not matched_findings:
+                LOGGER.info(
+                    "No (more) findings matched the filters (in this page); nothing to update."
+                )
+                continue
+
+            batch.extend(matched_findings)
+            while len(batch) >= MAX_BATCH_SIZE:
+                yield batch[:MAX_BATCH_SIZE]
+                batch = batch[MAX_BATCH_SIZE:]
+
+        if batch:
+            yield batch
+
+    def get_and_update(
+        self, max_findings: int | None = None, max_workers: int = 1
+    ) -> bool:
         """Get all the findings matching the rule's filters from AWS SecurityHub and update them according to the rule's updates.
 
+        All pages are fetched before any update is applied, since updated findings may no longer match the Filters
+        and would shift the remaining pages of the result set, so that findings are skipped.
+        Only the update payloads of the matched findings are kept until then, not the findings themselves.
+        The updates are then applied in batches in worker threads.
+        With a single worker, updates are applied one at a time and in page order.
+
+        Parameters
+        ----------
+        max_findings : int | None, optional
+            The maximum number of findings to get from AWS SecurityHub, all findings if not set
+        max_workers : int, optional
+            The maximum number of concurrent batch_update_findings calls, by default 1.
+            Mind the SecurityHub rate limits when increasing this.
+
         Returns
         -------
         bool
             True if all findings were processed successfully, False otherwise
         """
         paginator = self.client.get_paginator("get_findings")
+        pagination_config = {"PageSize": MAX_BATCH_SIZE}
+        if max_findings is not None:
+            pagination_config["MaxItems"] = max_findings
         page_iterator = paginator.paginate(
-            Filters=self.Filters, PaginationConfig={"MaxItems": 100, "PageSize": 100}
+            Filters=self.Filters, PaginationConfig=pagination_config
         )
 
-        any_unprocessed = False
-
-        for page in page_iterator:
-            matched_findings = [
-                finding
-                for finding in page["Findings"]
-                if self._match(finding, self._regex_string_filters)
-            ]
-
-            if not matched_findings:
-                LOGGER.info(
-                    "No (more) findings matched the filters (in this page); nothing to update."
-                )
-                continue
+        updates = [
+            update
+            for matched_findings in self._iter_matched_findings_batches(page_iterator)
+            for update in self._create_updates_to_apply(matched_findings)
+        ]
 
-            any_unprocessed = (
-                self.batch_update_findings(matched_findings) or any_unprocessed
-            )
+        any_unprocessed = False
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for is_unprocessed in executor.map(self._batch_update_findings, updates):
+                any_unprocessed = is_unprocessed or any_unprocessed
 
         return not any_unprocessed
 
     @staticmethod
-    def _match(
-        finding: dict[str, Any], filters: Mapping[str, Filter[Any, Any]]
-    ) -> bool:
+    def _match(finding: dict[str, Any], filters: tuple[_BoundFilter, ...]) -> bool:
         """Check if a finding matches the filters."""
-        return all(
-            (
-                any(
-                    aws_security_finding_filters.match(value)
-                    for value in get_values_by_boto_argument(finding, filter_name)
-                )
-            )
-            for filter_name, aws_security_finding_filters in filters.items()
-        )
+        # Plain loops instead of nested all/any generators, since this runs for every finding
+        for get_values, aws_security_finding_filters in filters:
+            filter_match = aws_security_finding_filters.match
+            for value in get_values(finding):
+                if filter_match(value):
+                    break
+            else:
+                return False
+        return True
 
     def match(self, finding: dict) -> bool:
         """Check if a finding matches the rule's filters.
@@ -332,6 +482,8 @@ class Rule:
         bool
             True if the finding matches the rule's filters, False otherwise
         """
-        return self._match(finding, self._filters) and self._match(
-            finding, self._regex_string_filters
+        return (
+            self._required_finding_keys <= finding.keys()
+            and self._match(finding, self._filters)
+            and self._match(finding, self._regex_string_filters)
         )
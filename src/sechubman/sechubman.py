@@ -1,5 +1,11 @@
 """The main module of sechubman."""
 
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from functools import cache
+
 import botocore.session
 from botocore.client import BaseClient
 
@@ -9,14 +15,66 @@ from .boto_utils import (
 )
 
 
+@cache
+def _get_default_session_client() -> BaseClient:
+    """Create the fallback SecurityHub client once, since it is only used for validation."""
+    return botocore.session.get_session().create_client("securityhub")
+
+
+# Content hashes of calls that passed validation, since validation is a pure function of its input
+# Bounded as a least recently used cache, since long-lived processes may validate many distinct calls
+_VALIDATED_CALLS: OrderedDict[str, None] = OrderedDict()
+_MAX_VALIDATED_CALLS = 1024
+# Guards the cache, since rules may be validated from several threads and an OrderedDict is not thread-safe
+_VALIDATED_CALLS_LOCK = threading.Lock()
+
+
+def _get_call_key(
+    stub_response: BotoStubCall, session_client: BaseClient
+) -> str | None:
+    """Get a content hash of a call, or None if its parameters are not plain JSON data."""
+    service_model = session_client.meta.service_model
+    try:
+        content = json.dumps(
+            [
+                service_model.service_name,
+                service_model.api_version,
+                stub_response.method,
+                stub_response.expected_params,
+            ],
+            sort_keys=True,
+        )
+    except (TypeError, ValueError):
+        # Values without a JSON form, e.g. datetimes, are always validated,
+        # since a string fallback could collide with a valid call
+        return None
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
 def _validate_call_params(
     stub_responses: list[BotoStubCall],
     session_client: BaseClient | None = None,
 ) -> None:
     if not session_client:
-        session_client = botocore.session.get_session().create_client("securityhub")
+        session_client = _get_default_session_client()
 
-    validate_call_params(stub_responses, session_client)
+    call_keys = [
+        _get_call_key(stub_response, session_client) for stub_response in stub_responses
+    ]
+    with _VALIDATED_CALLS_LOCK:
+        stub_responses_to_validate = [
+            stub_response
+            for stub_response, call_key in zip(stub_responses, call_keys, strict=True)
+            if call_key is None or call_key not in _VALIDATED_CALLS
+        ]
+    validate_call_params(stub_responses_to_validate, session_client)
+    with _VALIDATED_CALLS_LOCK:
+        for call_key in call_keys:
+            if call_key is not None:
+                _VALIDATED_CALLS[call_key] = None
+                _VALIDATED_CALLS.move_to_end(call_key)
+        while len(_VALIDATED_CALLS) > _MAX_VALIDATED_CALLS:
+            _VALIDATED_CALLS.popitem(last=False)
 
 
 def validate_filters(filters: dict, session_client: BaseClient | None = None) -> None:
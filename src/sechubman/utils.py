@@ -1,8 +1,10 @@
 """Utilities for sechubman."""
 
 from collections.abc import Callable, Collection
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass, fields
 from datetime import datetime
+from functools import cache, lru_cache
 
 
 def is_valid_against_reference(
@@ -14,6 +16,12 @@ def is_valid_against_reference(
     return not reference or validator(candidate, reference)
 
 
+@lru_cache(maxsize=4096)
+def _parse_timestamp_str(timestamp_str: str) -> datetime:
+    """Parse an ISO format timestamp string, cached since the same timestamps tend to recur."""
+    return datetime.fromisoformat(timestamp_str)
+
+
 def parse_timestamp_str_if_set(timestamp_str: str) -> datetime | None:
     """Parse an ISO format timestamp string to a datetime object if it is set.
 
@@ -27,10 +35,10 @@ def parse_timestamp_str_if_set(timestamp_str: str) -> datetime | None:
     datetime | None
         The parsed datetime object if the string is set, None otherwise
     """
-    return datetime.fromisoformat(timestamp_str) if timestamp_str else None
+    return _parse_timestamp_str(timestamp_str) if timestamp_str else None
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeRange:
     """Dataclass representing a time range with optional start or end."""
 
@@ -82,9 +90,11 @@ class TimeRange:
         bool
             True if the timestamp is within the range, False otherwise
         """
-        return is_valid_against_reference(
-            timestamp, self.start, datetime.__ge__
-        ) and is_valid_against_reference(timestamp, self.end, datetime.__le__)
+        # Inlined instead of using is_valid_against_reference, since this runs for every finding
+        start, end = self.start, self.end
+        return (start is None or timestamp >= start) and (
+            end is None or timestamp <= end
+        )
 
     def is_timestamp_str_in_range(self, timestamp_str: str) -> bool:
         """Check if a timestamp string is within the time range.
@@ -99,7 +109,7 @@ class TimeRange:
         bool
             True if the timestamp string is within the time range, False otherwise
         """
-        timestamp = datetime.fromisoformat(timestamp_str)
+        timestamp = _parse_timestamp_str(timestamp_str)
         return self.is_timestamp_in_range(timestamp)
 
 
@@ -118,9 +128,20 @@ def are_keys_in_collection(dict_: dict, collection: Collection) -> bool:
     bool
         True if all keys in the dict are in the collection, False otherwise
     """
+    # Sets allow a subset check in C instead of checking the keys one by one
+    if isinstance(collection, AbstractSet):
+        return dict_.keys() <= collection
     return all(key in collection for key in dict_)
 
 
+@cache
+def _get_field_names(dataclass_: type, *, init_only: bool = False) -> frozenset[str]:
+    """Get the (init) field names of a dataclass, cached since they are fixed per class."""
+    return frozenset(
+        field.name for field in fields(dataclass_) if field.init or not init_only
+    )
+
+
 def are_keys_in_dataclass_fields(dict_: dict, dataclass_: type) -> bool:
     """Check if all keys in a dict are fields in a dataclass.
 
@@ -136,4 +157,4 @@ def are_keys_in_dataclass_fields(dict_: dict, dataclass_: type) -> bool:
     bool
         True if all keys in the dict are fields in the dataclass, False otherwise
     """
-    return are_keys_in_collection(dict_, {field.name for field in fields(dataclass_)})
+    return dict_.keys() <= _get_field_names(dataclass_)
@@ -1,14 +1,17 @@
+import dataclasses
 import datetime
 import json
 import os
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import botocore.session
 import yaml
-from botocore.exceptions import ParamValidationError
+from botocore.exceptions import ClientError, ParamValidationError
 
+import sechubman
 from sechubman import (
     Manager,
     Rule,
@@ -17,9 +20,27 @@ from sechubman import (
 )
 from sechubman.boto_utils import (
     BotoStubCall,
+    create_boto_argument_getter,
     get_values_by_boto_argument,
     stub_boto_client,
+    validate_call_params,
 )
+from sechubman.filters import (
+    MapCriterion,
+    MapFilter,
+    NumberComparisons,
+    NumberCriterion,
+    NumberFilter,
+    StringCriterion,
+    StringFilter,
+    create_filters,
+)
+
+# The libyaml based loader parses the fixtures much faster, if PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 os.environ["AWS_DEFAULT_REGION"] = "eu-west-1"
 # Not strictly needed, but speeds up boto client creation
@@ -29,44 +50,62 @@ os.environ["AWS_SESSION_TOKEN"] = "abc123token"  # noqa: S105
 
 
 with Path("tests/fixtures/rules/correct_rules.yaml").open() as file:
-    CORRECT_RULES = yaml.safe_load(file)["Rules"]
+    CORRECT_RULES = yaml.load(file, Loader=SafeLoader)["Rules"]
 with Path("tests/fixtures/rules/broken_rules.yaml").open() as file:
-    BROKEN_RULES = yaml.safe_load(file)["Rules"]
+    BROKEN_RULES = yaml.load(file, Loader=SafeLoader)["Rules"]
 with Path("tests/fixtures/rules/condensed_rules.yaml").open() as file:
-    CONDENSED_RULES = yaml.safe_load(file)
+    CONDENSED_RULES = yaml.load(file, Loader=SafeLoader)
 with Path("tests/fixtures/rules/all_filter_types_match_rules.yaml").open() as file:
-    ALL_FILTER_TYPES_MATCH_RULES = yaml.safe_load(file)["Rules"]
+    ALL_FILTER_TYPES_MATCH_RULES = yaml.load(file, Loader=SafeLoader)["Rules"]
 with Path("tests/fixtures/rules/all_filter_types_no_match_rules.yaml").open() as file:
-    ALL_FILTER_TYPES_NO_MATCH_RULES = yaml.safe_load(file)["Rules"]
+    ALL_FILTER_TYPES_NO_MATCH_RULES = yaml.load(file, Loader=SafeLoader)["Rules"]
 with Path("tests/fixtures/rules/json_update_rules.yaml").open() as file:
-    JSON_RULES = yaml.safe_load(file)["Rules"]
+    JSON_RULES = yaml.load(file, Loader=SafeLoader)["Rules"]
 
-with Path("tests/fixtures/calls/filters.json").open() as file:
+with Path("tests/fixtures/calls/filters.json").open("rb") as file:
     FILTERS = json.load(file)
-with Path("tests/fixtures/responses/findings_trimmed.json").open() as file:
+with Path("tests/fixtures/responses/findings_trimmed.json").open("rb") as file:
     FINDINGS = json.load(file)
-with Path("tests/fixtures/responses/finding_groomed.json").open() as file:
+with Path("tests/fixtures/responses/finding_groomed.json").open("rb") as file:
     FINDING_GROOMED = json.load(file)
-with Path("tests/fixtures/calls/updates.json").open() as file:
+with Path("tests/fixtures/calls/updates.json").open("rb") as file:
     UPDATES = json.load(file)
-with Path("tests/fixtures/responses/processed.json").open() as file:
+with Path("tests/fixtures/responses/processed.json").open("rb") as file:
     PROCESSED = json.load(file)
-with Path("tests/fixtures/responses/unprocessed.json").open() as file:
+with Path("tests/fixtures/responses/unprocessed.json").open("rb") as file:
     UNPROCESSED = json.load(file)
-with Path("tests/fixtures/calls/json_updates.json").open() as file:
+with Path("tests/fixtures/calls/json_updates.json").open("rb") as file:
     JSON_UPDATES = json.load(file)
-with Path("tests/fixtures/calls/json_grouped_updates.json").open() as file:
+with Path("tests/fixtures/calls/json_grouped_updates.json").open("rb") as file:
     JSON_GROUPED_UPDATES = json.load(file)
-with Path("tests/fixtures/responses/json_update_grouped_findings.json").open() as file:
+with Path("tests/fixtures/responses/json_update_grouped_findings.json").open(
+    "rb"
+) as file:
     JSON_UPDATE_GROUPED_FINDINGS = json.load(file)
 
 SECURITYHUB_SESSION_CLIENT = botocore.session.get_session().create_client("securityhub")
 
+CONFIG_PRODUCT_ARN = "arn:aws:securityhub:eu-west-1::product/aws/config"
+
+
+def create_findings(ids: range) -> list[dict]:
+    return [{"Id": f"finding-{i}", "ProductArn": CONFIG_PRODUCT_ARN} for i in ids]
+
+
+def create_updates(findings: list[dict]) -> dict:
+    return {
+        **{key: value for key, value in UPDATES.items() if key != "FindingIdentifiers"},
+        "FindingIdentifiers": findings,
+    }
+
 
 class TestSmoke(TestCase):
     def test_sanity(self):
         self.assertTrue(expr=True)
 
+    def test_dir_lists_public_names(self):
+        self.assertLessEqual(set(sechubman.__all__), set(dir(sechubman)))
+
 
 class TestValidateFilters(TestCase):
     def test_valid_filters(self):
@@ -77,6 +116,23 @@ class TestValidateFilters(TestCase):
             ParamValidationError, validate_filters, BROKEN_RULES[0]["Filters"]
         )
 
+    def test_repeated_validation(self):
+        for _ in range(2):
+            self.assertIsNone(validate_filters(CORRECT_RULES[0]["Filters"]))
+            self.assertRaises(
+                ParamValidationError, validate_filters, BROKEN_RULES[0]["Filters"]
+            )
+
+    def test_unserializable_values_are_validated(self):
+        filters = {
+            "CreatedAt": [{"Start": "2024-01-01 00:00:00+00:00"}],
+        }
+        self.assertIsNone(validate_filters(filters))
+        filters["CreatedAt"][0]["Start"] = datetime.datetime(
+            2024, 1, 1, tzinfo=datetime.UTC
+        )
+        self.assertRaises(ParamValidationError, validate_filters, filters)
+
 
 class TestValidateUpdates(TestCase):
     def test_valid_updates(self):
@@ -97,6 +153,16 @@ class TestValidateUpdates(TestCase):
         )
 
 
+class TestValidateCallParams(TestCase):
+    def test_unknown_method(self):
+        with self.assertRaisesRegex(
+            ValueError, "Client securityhub does not have method: nope"
+        ):
+            validate_call_params(
+                [BotoStubCall("nope", {}, {})], SECURITYHUB_SESSION_CLIENT
+            )
+
+
 class TestGetValuesByBotoArgument(TestCase):
     def test_regular_field_returns_single_value(self):
         finding = {"Title": "Some title"}
@@ -128,6 +194,32 @@ class TestGetValuesByBotoArgument(TestCase):
         }
         self.assertEqual(get_values_by_boto_argument(finding, "ResourceId"), ["res-1"])
 
+    def test_special_case_nested_dict_path(self):
+        finding = {"Severity": {"Label": "HIGH"}}
+        self.assertEqual(
+            get_values_by_boto_argument(finding, "SeverityLabel"), ["HIGH"]
+        )
+
+    def test_special_case_nested_dict_path_missing(self):
+        for finding in ({}, {"Severity": {}}, {"Severity": "HIGH"}):
+            with self.subTest(finding=finding):
+                self.assertEqual(
+                    get_values_by_boto_argument(finding, "SeverityLabel"), []
+                )
+
+    def test_getter_matches_get_values(self):
+        finding = {
+            "Title": "Some title",
+            "Severity": {"Label": "HIGH"},
+            "Resources": [{"Id": "res-1"}, {"Id": "res-2"}],
+        }
+        for name in ("Title", "Description", "SeverityLabel", "ResourceId"):
+            with self.subTest(name=name):
+                self.assertEqual(
+                    create_boto_argument_getter(name)(finding),
+                    get_values_by_boto_argument(finding, name),
+                )
+
     def test_empty_tags(self):
         finding = {"Tags": {}}
         self.assertEqual(get_values_by_boto_argument(finding, "Tags"), [])
@@ -172,15 +264,166 @@ class TestGetValuesByBotoArgument(TestCase):
         )
 
 
+class TestStringFilter(TestCase):
+    def _create_filter(self, *comparisons: tuple[str, str]) -> StringFilter:
+        return StringFilter(
+            criterions=tuple(
+                StringCriterion(Comparison=comparison, Value=value)
+                for comparison, value in comparisons
+            )
+        )
+
+    def test_equals(self):
+        string_filter = self._create_filter(("EQUALS", "a"), ("EQUALS", "b"))
+        self.assertTrue(string_filter.match("b"))
+        self.assertFalse(string_filter.match("c"))
+
+    def test_not_equals(self):
+        string_filter = self._create_filter(("NOT_EQUALS", "a"), ("NOT_EQUALS", "b"))
+        self.assertFalse(string_filter.match("b"))
+        self.assertTrue(string_filter.match("c"))
+
+    def test_prefix(self):
+        string_filter = self._create_filter(("PREFIX", "a"), ("PREFIX", "bc"))
+        self.assertTrue(string_filter.match("bcd"))
+        self.assertFalse(string_filter.match("b"))
+
+    def test_overlapping_prefixes(self):
+        string_filter = self._create_filter(
+            ("PREFIX", "arn:aws:s3"), ("PREFIX", "arn:aws:"), ("PREFIX", "arn:aws:iam")
+        )
+        self.assertTrue(string_filter.match("arn:aws:ec2"))
+        self.assertFalse(string_filter.match("arn:aw"))
+
+    def test_prefix_not_equals(self):
+        string_filter = self._create_filter(
+            ("PREFIX_NOT_EQUALS", "a"), ("PREFIX_NOT_EQUALS", "bc")
+        )
+        self.assertFalse(string_filter.match("bcd"))
+        self.assertTrue(string_filter.match("b"))
+
+    def test_mixed_positive_comparisons(self):
+        string_filter = self._create_filter(("EQUALS", "a"), ("PREFIX", "b"))
+        self.assertTrue(string_filter.match("a"))
+        self.assertTrue(string_filter.match("bc"))
+        self.assertFalse(string_filter.match("c"))
+
+    def test_mixed_negative_comparisons(self):
+        string_filter = self._create_filter(
+            ("NOT_EQUALS", "a"), ("PREFIX_NOT_EQUALS", "b")
+        )
+        self.assertFalse(string_filter.match("a"))
+        self.assertFalse(string_filter.match("bc"))
+        self.assertTrue(string_filter.match("c"))
+
+    def test_mixed_positive_and_negative_comparisons(self):
+        self.assertRaises(
+            ValueError, self._create_filter, ("EQUALS", "a"), ("NOT_EQUALS", "b")
+        )
+
+    def test_derived_field_is_not_a_filter_key(self):
+        self.assertRaises(
+            ValueError,
+            create_filters,
+            [{"Comparison": "EQUALS", "Value": "a", "is_negative": True}],
+        )
+
+    def test_derived_field_is_a_dataclass_field(self):
+        self.assertTrue(
+            sechubman.are_keys_in_dataclass_fields(
+                {"Value": "a", "is_negative": True}, StringCriterion
+            )
+        )
+
+    def test_identical_filters_are_not_shared(self):
+        filters_dicts = [{"Comparison": "EQUALS", "Value": "a"}]
+        self.assertIsNot(create_filters(filters_dicts), create_filters(filters_dicts))
+
+    def test_asdict(self):
+        string_filter = self._create_filter(("EQUALS", "a"))
+        self.assertEqual(
+            dataclasses.asdict(string_filter)["criterions"][0]["Value"], "a"
+        )
+
+    def test_non_string_value(self):
+        self.assertEqual(StringCriterion(Comparison="EQUALS", Value=1).Value, 1)
+
+    def test_match_many(self):
+        string_filter = self._create_filter(("EQUALS", "a"), ("PREFIX", "b"))
+        self.assertEqual(
+            string_filter.match_many(["a", "bc", "c"]), [True, True, False]
+        )
+
+    def test_negative_match_many(self):
+        string_filter = self._create_filter(
+            ("NOT_EQUALS", "a"), ("PREFIX_NOT_EQUALS", "b")
+        )
+        self.assertEqual(
+            string_filter.match_many(["a", "bc", "c"]), [False, False, True]
+        )
+
+
+class TestNumberFilter(TestCase):
+    def test_criterion_matches_comparisons(self):
+        for comparison in NumberComparisons:
+            criterion = NumberCriterion(**{comparison.name: 5})
+            for finding_value in (4, 5, 6.5):
+                with self.subTest(comparison=comparison, finding_value=finding_value):
+                    self.assertEqual(
+                        criterion.match(finding_value),
+                        comparison.value(finding_value, 5),
+                    )
+
+    def test_equal_filters(self):
+        self.assertEqual(NumberCriterion(Eq=1), NumberCriterion(Eq=1))
+        self.assertEqual(
+            NumberFilter(criterions=(NumberCriterion(Gte=1, Lt=5),)),
+            NumberFilter(criterions=(NumberCriterion(Gte=1, Lt=5),)),
+        )
+
+
+class TestMapFilter(TestCase):
+    def _create_filter(self, *comparisons: tuple[str, str, str]) -> MapFilter:
+        return MapFilter(
+            criterions=tuple(
+                MapCriterion(Comparison=comparison, Key=key, Value=value)
+                for comparison, key, value in comparisons
+            )
+        )
+
+    def test_non_string_key_and_value(self):
+        map_criterion = MapCriterion(Comparison="EQUALS", Key=1, Value=2)
+        self.assertEqual((map_criterion.Key, map_criterion.Value), (1, 2))
+
+    def test_equals(self):
+        map_filter = self._create_filter(
+            ("EQUALS", "env", "dev"), ("EQUALS", "env", "test"), ("EQUALS", "team", "a")
+        )
+        self.assertTrue(map_filter.match({"env": "test"}))
+        self.assertTrue(map_filter.match({"env": "prod", "team": "a"}))
+        self.assertFalse(map_filter.match({"env": "prod"}))
+        self.assertFalse(map_filter.match({}))
+
+    def test_not_equals(self):
+        map_filter = self._create_filter(
+            ("NOT_EQUALS", "env", "dev"), ("NOT_EQUALS", "env", "test")
+        )
+        self.assertTrue(map_filter.match({"env": "prod"}))
+        self.assertFalse(map_filter.match({"env": "dev"}))
+        self.assertFalse(map_filter.match({"team": "a"}))
+
+
 class TestRuleDataclass(TestCase):
-    def setUp(self):
-        self.fixed_now = datetime.datetime(2026, 1, 1, 12, 0, 0, 0, datetime.UTC)
+    @classmethod
+    def setUpClass(cls):
+        # Patched once for the whole class, since no test changes the fixed time
+        cls.fixed_now = datetime.datetime(2026, 1, 1, 12, 0, 0, 0, datetime.UTC)
         patcher = patch(
             "sechubman.filters.DateCriterion._now_utc",
-            return_value=self.fixed_now,
+            return_value=cls.fixed_now,
         )
-        self.addCleanup(patcher.stop)
-        self.mock_now = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+        cls.mock_now = patcher.start()
 
     def _test_multiple_valid_rules(self, rules: list[dict]):
         for rule_dict in rules:
@@ -231,6 +474,119 @@ class TestRuleDataclass(TestCase):
         ):
             self.assertTrue(rule.get_and_update())
 
+    def _patch_pages(self, pages: Iterable[dict]) -> MagicMock:
+        # The pages are served without the Stubber, so the pagination config can be checked
+        # and many pages can be served without chaining NextTokens
+        paginator = MagicMock()
+        paginator.paginate.return_value = pages
+        patcher = patch.object(
+            SECURITYHUB_SESSION_CLIENT, "get_paginator", return_value=paginator
+        )
+        self.addCleanup(patcher.stop)
+        patcher.start()
+        return paginator
+
+    def test_apply_batches_across_pages(self):
+        rule = Rule(**CORRECT_RULES[0], client=SECURITYHUB_SESSION_CLIENT)
+        # The second page repeats ten findings of the first page
+        first_page = create_findings(range(100))
+        second_page = create_findings(range(90, 150))
+        paginator = self._patch_pages(
+            [{"Findings": first_page}, {"Findings": second_page}]
+        )
+        with stub_boto_client(
+            SECURITYHUB_SESSION_CLIENT,
+            [
+                BotoStubCall(
+                    "batch_update_findings", PROCESSED, create_updates(first_page)
+                ),
+                BotoStubCall(
+                    "batch_update_findings",
+                    PROCESSED,
+                    create_updates(second_page[10:]),
+                ),
+            ],
+        ):
+            self.assertTrue(rule.get_and_update())
+        paginator.paginate.assert_called_once_with(
+            Filters=rule.Filters, PaginationConfig={"PageSize": 100}
+        )
+
+    def test_apply_after_all_pages(self):
+        rule = Rule(**CORRECT_RULES[0], client=SECURITYHUB_SESSION_CLIENT)
+        events = []
+
+        # Updated findings drop out of the filters server-side, so updating them
+        # while paginating would shift the remaining pages
+        def pages() -> Iterator[dict]:
+            for i in (0, 100):
+                events.append("get_findings")
+                yield {"Findings": create_findings(range(i, i + 100))}
+
+        def batch_update_findings(**_: object) -> dict:
+            events.append("batch_update_findings")
+            return PROCESSED
+
+        self._patch_pages(pages())
+        with patch.object(
+            SECURITYHUB_SESSION_CLIENT,
+            "batch_update_findings",
+            side_effect=batch_update_findings,
+        ):
+            self.assertTrue(rule.get_and_update(max_workers=2))
+        self.assertEqual(events, ["get_findings"] * 2 + ["batch_update_findings"] * 2)
+
+    def test_apply_max_findings(self):
+        rule = Rule(**CORRECT_RULES[0], client=SECURITYHUB_SESSION_CLIENT)
+        findings = create_findings(range(5))
+        paginator = self._patch_pages([{"Findings": findings}])
+        with stub_boto_client(
+            SECURITYHUB_SESSION_CLIENT,
+            [
+                BotoStubCall(
+                    "batch_update_findings", PROCESSED, create_updates(findings)
+                )
+            ],
+        ):
+            self.assertTrue(rule.get_and_update(max_findings=5))
+        paginator.paginate.assert_called_once_with(
+            Filters=rule.Filters, PaginationConfig={"PageSize": 100, "MaxItems": 5}
+        )
+
+    def test_apply_multiple_workers(self):
+        rule = Rule(**CORRECT_RULES[0], client=SECURITYHUB_SESSION_CLIENT)
+        self._patch_pages(
+            [{"Findings": create_findings(range(i, i + 100))} for i in (0, 100, 200)]
+        )
+        with patch.object(
+            SECURITYHUB_SESSION_CLIENT, "batch_update_findings", return_value=PROCESSED
+        ) as batch_update_findings:
+            self.assertTrue(rule.get_and_update(max_workers=2))
+        updated_ids = sorted(
+            identifier["Id"]
+            for call in batch_update_findings.call_args_list
+            for identifier in call.kwargs["FindingIdentifiers"]
+        )
+        self.assertEqual(batch_update_findings.call_count, 3)
+        self.assertEqual(
+            updated_ids,
+            sorted(finding["Id"] for finding in create_findings(range(300))),
+        )
+
+    def test_apply_worker_exception(self):
+        rule = Rule(**CORRECT_RULES[0], client=SECURITYHUB_SESSION_CLIENT)
+        self._patch_pages([{"Findings": create_findings(range(5))}])
+        error = ClientError(
+            {"Error": {"Code": "TooManyRequestsException"}}, "BatchUpdateFindings"
+        )
+        with (
+            patch.object(
+                SECURITYHUB_SESSION_CLIENT, "batch_update_findings", side_effect=error
+            ),
+            self.assertRaises(ClientError),
+        ):
+            rule.get_and_update(max_workers=2)
+
     def test_manager_apply(self):
         manager = Manager(
             **CONDENSED_RULES["ManagerConfig"], client=SECURITYHUB_SESSION_CLIENT
@@ -297,6 +653,16 @@ class TestRuleDataclass(TestCase):
         ):
             self.assertTrue(manager.match_and_update(FINDING_GROOMED))
 
+    def test_rules_share_identical_filters(self):
+        first_rule = Rule(**CORRECT_RULES[0], client=SECURITYHUB_SESSION_CLIENT)
+        second_rule = Rule(**CORRECT_RULES[0], client=SECURITYHUB_SESSION_CLIENT)
+        for (_, first_filter), (_, second_filter) in zip(
+            first_rule._filters,  # noqa: SLF001
+            second_rule._filters,  # noqa: SLF001
+            strict=True,
+        ):
+            self.assertIs(first_filter, second_filter)
+
     def test_match(self):
         for all_filter_type_match_rule in ALL_FILTER_TYPES_MATCH_RULES:
             with self.subTest(all_filter_type_match_rule=all_filter_type_match_rule):
@@ -316,3 +682,18 @@ class TestRuleDataclass(TestCase):
                     client=SECURITYHUB_SESSION_CLIENT,
                 )
                 self.assertFalse(rule.match(FINDING_GROOMED))
+
+    def test_no_match_missing_keys(self):
+        for all_filter_type_match_rule in ALL_FILTER_TYPES_MATCH_RULES:
+            with self.subTest(all_filter_type_match_rule=all_filter_type_match_rule):
+                getter = MagicMock(return_value=[])
+                with patch(
+                    "sechubman.rule.create_boto_argument_getter",
+                    return_value=getter,
+                ):
+                    rule = Rule(
+                        **all_filter_type_match_rule,
+                        client=SECURITYHUB_SESSION_CLIENT,
+                    )
+                self.assertFalse(rule.match({}))
+                getter.assert_not_called()